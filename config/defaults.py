@@ -15,3 +15,4 @@ AUDIO_ALARM_THRESHOLD = 25.0
 
 CUSUM_K = 0.05
 CUSUM_THRESHOLD = 10.0
+CUSUM_CHECK_EVERY = 5
@@ -8,6 +8,7 @@ from pathlib import Path
 BASE_DIR = Path(os.path.expanduser("~/.sentinel"))
 
 STATE_FILE = BASE_DIR / "state.json"
-SHORT_MODEL_FILE = BASE_DIR / "model_short.npz"
-LONG_MODEL_FILE = BASE_DIR / "model_long.npz"
+# Stems: persistence derives one .npy file per model array from these.
+SHORT_MODEL_FILE = BASE_DIR / "model_short"
+LONG_MODEL_FILE = BASE_DIR / "model_long"
 LOG_FILE = BASE_DIR / "sentinel.log"
@@ -6,14 +6,18 @@ from .anomaly import RiskAccumulator, calculate_severity
 from .contamination import is_contaminated
 from .drift import DriftDetector, calculate_divergence
 from .model import StatisticalModel
+from .model_bank import StatisticalModelBank
 from .persistence import PersistenceManager
+from .welford import WelfordAccumulator
 
 __all__ = [
     "StatisticalModel",
+    "StatisticalModelBank",
     "calculate_severity",
     "RiskAccumulator",
     "DriftDetector",
     "calculate_divergence",
     "is_contaminated",
     "PersistenceManager",
+    "WelfordAccumulator",
 ]
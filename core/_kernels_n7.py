@@ -0,0 +1,139 @@
+"""
+Numba kernels specialized for the fixed 7-dimensional feature space.
+
+FEATURE_KEYS defines exactly seven features, so the hot per-sample
+kernels can iterate over literal range(7) bounds. The constant trip
+count lets LLVM fully unroll the loops into straight-line SIMD code
+instead of dispatching tiny BLAS calls.
+"""
+
+import numpy as np
+from numba import njit
+
+N_FEATURES = 7
+
+_JIT_OPTIONS = {
+    "cache": True,
+    "fastmath": True,
+    "boundscheck": False,
+    "error_model": "numpy",
+}
+
+
+@njit(**_JIT_OPTIONS)
+def mahal_sq_n7(diff: np.ndarray, cov_L: np.ndarray) -> float:
+    """Computes the squared Mahalanobis distance for a 7-vector.
+
+    Args:
+        diff (np.ndarray): The deviation vector x - mu of length 7.
+        cov_L (np.ndarray): The 7x7 lower-triangular Cholesky factor.
+
+    Returns:
+        float: The squared Mahalanobis distance.
+    """
+    y = np.empty(7)
+    m_squared = 0.0
+
+    for i in range(7):
+        acc = diff[i]
+        for j in range(i):
+            acc -= cov_L[i, j] * y[j]
+        y[i] = acc / cov_L[i, i]
+        m_squared += y[i] * y[i]
+
+    return m_squared
+
+
+@njit(**_JIT_OPTIONS)
+def rank1_update_n7(
+    cov: np.ndarray, diff: np.ndarray, lambda_factor: float, one_minus_lambda: float
+):
+    """Applies the EWMA rank-1 covariance update in place for a 7x7 matrix.
+
+    Args:
+        cov (np.ndarray): The 7x7 covariance matrix, mutated in place.
+        diff (np.ndarray): The deviation vector x - mu of length 7.
+        lambda_factor (float): The exponential weighting factor.
+        one_minus_lambda (float): The precomputed complement 1 - lambda_factor.
+    """
+    for i in range(7):
+        d_i = lambda_factor * diff[i]
+        for j in range(7):
+            cov[i, j] = one_minus_lambda * cov[i, j] + d_i * diff[j]
+
+
+@njit(**_JIT_OPTIONS)
+def chol_update_n7(
+    cov_L: np.ndarray, diff: np.ndarray, lambda_factor: float, one_minus_lambda: float
+) -> bool:
+    """Applies the EWMA rank-1 update directly to a 7x7 Cholesky factor.
+
+    Rewrites the recursion C <- (1-lambda)C + lambda*diff*diffT as a
+    scaling of the factor by sqrt(1-lambda) followed by a hyperbolic
+    rotation pass with sqrt(lambda)*diff, so the factor is maintained in
+    O(d^2) without refactorizing.
+
+    Args:
+        cov_L (np.ndarray): The 7x7 lower-triangular factor, mutated in place.
+        diff (np.ndarray): The deviation vector x - mu of length 7.
+        lambda_factor (float): The exponential weighting factor.
+        one_minus_lambda (float): The precomputed complement 1 - lambda_factor.
+
+    Returns:
+        bool: True on success, False if the factor degenerated; the
+            buffer contents are unspecified on failure.
+    """
+    scale = np.sqrt(one_minus_lambda)
+    sqrt_lambda = np.sqrt(lambda_factor)
+    x = np.empty(7)
+
+    for i in range(7):
+        x[i] = sqrt_lambda * diff[i]
+        for j in range(i + 1):
+            cov_L[i, j] = scale * cov_L[i, j]
+
+    for k in range(7):
+        l_kk = cov_L[k, k]
+        if l_kk <= 0.0:
+            return False
+
+        r = np.sqrt(l_kk * l_kk + x[k] * x[k])
+        c = r / l_kk
+        s = x[k] / l_kk
+        cov_L[k, k] = r
+
+        for i in range(k + 1, 7):
+            cov_L[i, k] = (cov_L[i, k] + s * x[i]) / c
+            x[i] = c * x[i] - s * cov_L[i, k]
+
+    return True
+
+
+@njit(**_JIT_OPTIONS)
+def cholesky_n7(cov: np.ndarray, out: np.ndarray) -> bool:
+    """Computes the lower-triangular Cholesky factor of a 7x7 matrix.
+
+    Args:
+        cov (np.ndarray): The 7x7 symmetric matrix to factorize.
+        out (np.ndarray): The 7x7 output buffer receiving the factor.
+
+    Returns:
+        bool: True on success, False if the matrix is not positive definite.
+    """
+    for i in range(7):
+        for j in range(i + 1):
+            acc = cov[i, j]
+            for k in range(j):
+                acc -= out[i, k] * out[j, k]
+
+            if i == j:
+                if acc <= 0.0:
+                    return False
+                out[i, i] = np.sqrt(acc)
+            else:
+                out[i, j] = acc / out[j, j]
+
+        for j in range(i + 1, 7):
+            out[i, j] = 0.0
+
+    return True
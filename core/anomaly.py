@@ -5,29 +5,27 @@ Anomaly detection and risk scoring mechanisms.
 import numpy as np
 
 from config import defaults
+from core._fastpath import risk_step
 from utils.math_utils import calculate_mahalanobis
 
 
 def calculate_severity(
-    x_t: np.ndarray, mu: np.ndarray, cov_inv: np.ndarray, threshold: float
+    x_t: np.ndarray, mu: np.ndarray, cov_L: np.ndarray, inv_threshold: float
 ) -> float:
     """Calculates the severity score of an incoming vector.
 
     Args:
         x_t (np.ndarray): The current vector.
         mu (np.ndarray): The mean vector.
-        cov_inv (np.ndarray): The inverse covariance matrix.
-        threshold (float): The baseline distance threshold.
+        cov_L (np.ndarray): The lower-triangular Cholesky factor of the covariance.
+        inv_threshold (float): The reciprocal of the baseline distance threshold, or 0.0 when uncalibrated.
 
     Returns:
         float: The calculated severity score.
     """
-    distance = calculate_mahalanobis(x_t, mu, cov_inv)
+    distance = calculate_mahalanobis(x_t, mu, cov_L)
 
-    if threshold <= 0.0:
-        return 0.0
-
-    return distance / threshold
+    return distance * inv_threshold
 
 
 class RiskAccumulator:
@@ -51,14 +49,6 @@ class RiskAccumulator:
         Returns:
             tuple[float, bool]: A tuple containing the current risk and a boolean indicating if an anomaly state is reached.
         """
-        if severity > 1.0:
-            self.risk += 4.0 * (severity - 1.0) ** 2
-        else:
-            self.risk *= 0.95
-
-        is_anomaly = self.risk > self.alert_threshold
-
-        if is_anomaly:
-            self.risk *= 0.5
+        self.risk, is_anomaly = risk_step(self.risk, severity, self.alert_threshold)
 
-        return self.risk, is_anomaly
+        return self.risk, bool(is_anomaly)
@@ -5,41 +5,57 @@ Drift detection algorithms for long-term changes.
 import numpy as np
 
 from config import defaults
+from core._fastpath import cusum_step
 
 
 class DriftDetector:
     """Detects concept drift using the CUSUM algorithm."""
 
     def __init__(
-        self, k: float = defaults.CUSUM_K, threshold: float = defaults.CUSUM_THRESHOLD
+        self,
+        k: float = defaults.CUSUM_K,
+        threshold: float = defaults.CUSUM_THRESHOLD,
+        check_every: int = defaults.CUSUM_CHECK_EVERY,
     ):
         """Initializes the drift detector.
 
         Args:
             k (float, optional): The sensitivity parameter. Defaults to defaults.CUSUM_K.
             threshold (float, optional): The threshold for signaling drift. Defaults to defaults.CUSUM_THRESHOLD.
+            check_every (int, optional): Number of samples to accumulate between drift evaluations. Defaults to defaults.CUSUM_CHECK_EVERY.
         """
         self.c_t: float = 0.0
         self.k: float = k
         self.threshold: float = threshold
+        self.check_every: int = check_every
+        self._accum: float = 0.0
+        self._counter: int = 0
 
     def update_cusum(self, severity: float) -> bool:
         """Updates the CUSUM statistic and evaluates drift.
 
+        The per-sample work is a single accumulation; the statistic and
+        the threshold comparison are only evaluated every check_every-th
+        sample, which is exact for drift processes far slower than the
+        sampling rate.
+
         Args:
             severity (float): The current severity value.
 
         Returns:
             bool: True if drift is detected, False otherwise.
         """
-        self.c_t = max(0.0, self.c_t + (severity - self.k))
+        self._accum += severity - self.k
+        self._counter += 1
 
-        is_drift = self.c_t > self.threshold
+        if self._counter < self.check_every:
+            return False
 
-        if is_drift:
-            self.c_t = 0.0
+        self.c_t, is_drift = cusum_step(self.c_t, self._accum, self.threshold)
+        self._accum = 0.0
+        self._counter = 0
 
-        return is_drift
+        return bool(is_drift)
 
 
 def calculate_divergence(mu_short: np.ndarray, mu_long: np.ndarray) -> float:
@@ -52,4 +68,5 @@ def calculate_divergence(mu_short: np.ndarray, mu_long: np.ndarray) -> float:
     Returns:
         float: The L2 norm of the difference between the means.
     """
-    return float(np.linalg.norm(mu_short - mu_long))
+    d = mu_short - mu_long
+    return float(np.sqrt(d @ d))
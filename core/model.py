@@ -5,14 +5,23 @@ Adaptive statistical model representing the system baseline.
 import numpy as np
 
 from config import defaults
-from core.stability import safe_invert
+from core._kernels_n7 import N_FEATURES, chol_update_n7
+from core.stability import safe_cholesky
 from core.updates import update_covariance, update_mean
-from utils.math_utils import calculate_mahalanobis
+from utils.math_utils import calculate_mahalanobis_batch
 
 
 class StatisticalModel:
     """Maintains and updates the statistical properties of a dataset."""
 
+    # Rank-1 updates whose weighted magnitude stays below this bound
+    # leave the covariance essentially unchanged, so the existing
+    # Cholesky factor is reused instead of refactorizing.
+    FACTOR_SKIP_THRESHOLD = 1e-8
+    # Cap on consecutive ticks without a full refactorization so
+    # floating-point staleness stays bounded.
+    FACTOR_RESYNC_TICKS = 60
+
     def __init__(self, lambda_factor: float):
         """Initializes the model.
 
@@ -20,12 +29,29 @@ class StatisticalModel:
             lambda_factor (float): The exponential forgetting factor.
         """
         self.lambda_factor = lambda_factor
+        self._one_minus_lambda = 1.0 - lambda_factor
         self.mu: np.ndarray | None = None
         self.cov: np.ndarray | None = None
-        self.cov_inv: np.ndarray | None = None
-        self.threshold: float = 0.0
+        self.cov_L: np.ndarray | None = None
+        self.threshold = 0.0
         self.is_initialized: bool = False
         self.is_frozen: bool = False
+        self._stale_factor_ticks: int = 0
+
+    @property
+    def threshold(self) -> float:
+        """The baseline distance threshold."""
+        return self._threshold
+
+    @threshold.setter
+    def threshold(self, value: float):
+        """Sets the threshold and keeps its cached reciprocal in sync.
+
+        Args:
+            value (float): The new threshold value.
+        """
+        self._threshold = float(value)
+        self.inv_threshold = 1.0 / self._threshold if self._threshold > 0.0 else 0.0
 
     def initialize_from_batch(self, data: np.ndarray):
         """Initializes the model parameters from a batch of data.
@@ -33,15 +59,34 @@ class StatisticalModel:
         Args:
             data (np.ndarray): The batch data matrix.
         """
-        self.mu = np.mean(data, axis=0)
-        self.cov = np.cov(data, rowvar=False)
+        self.initialize_from_moments(
+            np.mean(data, axis=0), np.cov(data, rowvar=False), data
+        )
+
+    def initialize_from_moments(
+        self, mu: np.ndarray, cov: np.ndarray, data: np.ndarray
+    ):
+        """Initializes the model from precomputed first and second moments.
+
+        Allows training pipelines to accumulate statistics incrementally
+        (e.g. via WelfordAccumulator) instead of recomputing them from
+        the full batch per model.
+
+        Args:
+            mu (np.ndarray): The mean vector.
+            cov (np.ndarray): The covariance matrix.
+            data (np.ndarray): The batch used to calibrate the distance threshold.
+        """
+        # System metrics are noisy enough that float32 moments lose no
+        # useful signal, and the narrower rows halve BLAS memory
+        # traffic; the EPSILON_BASE diagonal ridge already keeps the
+        # factorization well-conditioned at this precision.
+        self.mu = np.array(mu, dtype=np.float32)
+        self.cov = np.array(cov, dtype=np.float32)
 
-        self.cov_inv, self.is_frozen, _ = safe_invert(self.cov)
+        self.cov_L, self.is_frozen, _ = safe_cholesky(self.cov)
 
-        distances = []
-        for x in data:
-            d = calculate_mahalanobis(x, self.mu, self.cov_inv)
-            distances.append(d)
+        distances = calculate_mahalanobis_batch(data, self.mu, self.cov_L)
 
         self.threshold = float(np.percentile(distances, 99))
         self.is_initialized = True
@@ -59,17 +104,38 @@ class StatisticalModel:
             severity (float): The anomaly severity of the vector.
             severity_limit (float, optional): The contamination limit. Defaults to defaults.CONTAMINATION_LIMIT.
         """
-        if not self.is_initialized or self.is_frozen:
+        # Single combined guard: reject contaminated samples before any
+        # matrix work is attempted.
+        if self.is_frozen or not self.is_initialized or severity >= severity_limit:
             return
 
-        if severity >= severity_limit:
-            return
+        diff = x_t - self.mu
+        new_cov = update_covariance(
+            self.cov, self.mu, x_t, self.lambda_factor, self._one_minus_lambda
+        )
+
+        new_mu = update_mean(
+            self.mu, x_t, self.lambda_factor, self._one_minus_lambda
+        )
+
+        factor_fresh = self._stale_factor_ticks < self.FACTOR_RESYNC_TICKS
 
-        new_cov = update_covariance(self.cov, self.mu, x_t, self.lambda_factor)
+        delta = self.lambda_factor * float(diff @ diff)
+        if delta < self.FACTOR_SKIP_THRESHOLD and factor_fresh:
+            self.cov = new_cov
+            self.mu = new_mu
+            self._stale_factor_ticks += 1
+            return
 
-        new_mu = update_mean(self.mu, x_t, self.lambda_factor)
+        # O(d^2) rank-1 maintenance of the factor; the periodic full
+        # refactorization below bounds accumulated rounding drift.
+        if factor_fresh and self._try_rank1_factor_update(diff):
+            self.cov = new_cov
+            self.mu = new_mu
+            self._stale_factor_ticks += 1
+            return
 
-        new_cov_inv, freeze_flag, _ = safe_invert(new_cov)
+        new_cov_L, freeze_flag, _ = safe_cholesky(new_cov)
 
         if freeze_flag:
             self.is_frozen = True
@@ -77,4 +143,27 @@ class StatisticalModel:
 
         self.cov = new_cov
         self.mu = new_mu
-        self.cov_inv = new_cov_inv
+        self.cov_L = new_cov_L
+        self._stale_factor_ticks = 0
+
+    def _try_rank1_factor_update(self, diff: np.ndarray) -> bool:
+        """Attempts to advance the Cholesky factor by one EWMA step.
+
+        Args:
+            diff (np.ndarray): The deviation vector x - mu.
+
+        Returns:
+            bool: True if the factor was updated in place, False if the
+                caller must refactorize.
+        """
+        if diff.shape[0] != N_FEATURES:
+            return False
+
+        candidate = self.cov_L.copy()
+        if not chol_update_n7(
+            candidate, diff, self.lambda_factor, self._one_minus_lambda
+        ):
+            return False
+
+        self.cov_L = candidate
+        return True
@@ -0,0 +1,111 @@
+"""
+Structure-of-arrays container for ensembles of statistical baselines.
+"""
+
+import numpy as np
+
+from config import defaults
+from core.stability import DEFAULT_EPSILON
+
+
+class StatisticalModelBank:
+    """Maintains K parallel baselines in batched array storage.
+
+    Instead of K StatisticalModel instances each holding their own
+    arrays, the bank stores stacked mus (K, d), covs (K, d, d) and
+    cov_invs (K, d, d) so every per-sample operation runs as one
+    broadcast NumPy expression over the model axis.
+    """
+
+    def __init__(self, n_models: int, n_features: int, lambda_factor: float):
+        """Initializes the bank.
+
+        Args:
+            n_models (int): The number of parallel baselines K.
+            n_features (int): The feature dimension d.
+            lambda_factor (float): The exponential forgetting factor shared by all baselines.
+        """
+        self.n_models = n_models
+        self.n_features = n_features
+        self.lambda_factor = lambda_factor
+
+        self.mus = np.zeros((n_models, n_features))
+        self.covs = np.zeros((n_models, n_features, n_features))
+        self.cov_invs = np.zeros((n_models, n_features, n_features))
+        self.thresholds = np.zeros(n_models)
+        self.inv_thresholds = np.zeros(n_models)
+        self.is_initialized: bool = False
+
+    def initialize_from_batches(self, batches: np.ndarray):
+        """Initializes every baseline from its own training batch.
+
+        Args:
+            batches (np.ndarray): A (K, N, d) array holding N training samples per baseline.
+        """
+        self.mus = batches.mean(axis=1)
+
+        n_samples = batches.shape[1]
+        diffs = batches - self.mus[:, None, :]
+        self.covs = np.einsum("kni,knj->kij", diffs, diffs) / (n_samples - 1)
+
+        reg_covs = self.covs + DEFAULT_EPSILON * np.eye(self.n_features)
+        self.cov_invs = np.linalg.inv(reg_covs)
+
+        m_sq = np.einsum("kni,kij,knj->kn", diffs, self.cov_invs, diffs)
+        distances = np.sqrt(np.maximum(0.0, m_sq))
+
+        self.thresholds = np.percentile(distances, 99, axis=1)
+        with np.errstate(divide="ignore"):
+            self.inv_thresholds = np.where(
+                self.thresholds > 0.0, 1.0 / self.thresholds, 0.0
+            )
+        self.is_initialized = True
+
+    def calculate_severities(self, x_t: np.ndarray) -> np.ndarray:
+        """Computes the severity of one sample against every baseline.
+
+        Args:
+            x_t (np.ndarray): The incoming feature vector.
+
+        Returns:
+            np.ndarray: The K severity scores.
+        """
+        diffs = x_t[None, :] - self.mus
+        m_sq = np.einsum("ki,kij,kj->k", diffs, self.cov_invs, diffs)
+
+        return np.sqrt(np.maximum(0.0, m_sq)) * self.inv_thresholds
+
+    def update_all(
+        self,
+        x_t: np.ndarray,
+        severities: np.ndarray,
+        severity_limit: float = defaults.CONTAMINATION_LIMIT,
+    ):
+        """Performs the online update on every uncontaminated baseline.
+
+        Args:
+            x_t (np.ndarray): The incoming feature vector.
+            severities (np.ndarray): The K severity scores of the vector.
+            severity_limit (float, optional): The contamination limit. Defaults to defaults.CONTAMINATION_LIMIT.
+        """
+        if not self.is_initialized:
+            return
+
+        mask = severities < severity_limit
+        if not mask.any():
+            return
+
+        lam = self.lambda_factor
+        diffs = x_t[None, :] - self.mus
+        outers = np.einsum("ki,kj->kij", diffs, diffs)
+
+        new_mus = (1.0 - lam) * self.mus + lam * x_t
+        new_covs = (1.0 - lam) * self.covs + lam * outers
+
+        self.mus = np.where(mask[:, None], new_mus, self.mus)
+        self.covs = np.where(mask[:, None, None], new_covs, self.covs)
+
+        reg_covs = self.covs + DEFAULT_EPSILON * np.eye(self.n_features)
+        self.cov_invs = np.where(
+            mask[:, None, None], np.linalg.inv(reg_covs), self.cov_invs
+        )
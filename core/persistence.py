@@ -2,15 +2,18 @@
 State persistence management for models and configuration.
 """
 
-import json
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import numpy as np
+import orjson
 
 from config import paths
+from core.stability import safe_cholesky
 from utils.atomic_write import atomic_write
 
+_MODEL_ARRAYS = ("mu", "cov", "cov_L")
+
 
 class PersistenceManager:
     """Manages saving and loading of model states and parameters."""
@@ -21,42 +24,90 @@ class PersistenceManager:
         self.short_model_file = paths.SHORT_MODEL_FILE
         self.long_model_file = paths.LONG_MODEL_FILE
 
+    def _array_path(self, filepath: Path, name: str) -> Path:
+        """Derives the per-array file path for a model stem.
+
+        Args:
+            filepath (Path): The model file stem.
+            name (str): The array name.
+
+        Returns:
+            Path: The .npy path holding that array.
+        """
+        return filepath.with_name(f"{filepath.name}_{name}.npy")
+
     def save_model(
-        self, filepath: Path, mu: np.ndarray, cov: np.ndarray, cov_inv: np.ndarray
+        self, filepath: Path, mu: np.ndarray, cov: np.ndarray, cov_L: np.ndarray
     ):
-        """Atomically saves matrix states to disk.
+        """Atomically saves matrix states to disk, one .npy file per array.
 
         Args:
-            filepath (Path): The destination file path.
+            filepath (Path): The destination model file stem.
             mu (np.ndarray): The mean vector.
             cov (np.ndarray): The covariance matrix.
-            cov_inv (np.ndarray): The inverse covariance matrix.
+            cov_L (np.ndarray): The lower-triangular Cholesky factor of the covariance.
         """
-        if mu is None or cov is None or cov_inv is None:
+        if mu is None or cov is None or cov_L is None:
             return
 
-        with atomic_write(filepath, mode="wb") as f:
-            np.savez_compressed(f, mu=mu, cov=cov, cov_inv=cov_inv)
+        for name, arr in zip(_MODEL_ARRAYS, (mu, cov, cov_L)):
+            with atomic_write(self._array_path(filepath, name), mode="wb") as f:
+                np.save(f, arr)
 
     def load_model(self, filepath: Path) -> Optional[Dict[str, np.ndarray]]:
         """Loads matrix states from disk.
 
+        The per-array .npy files are memory-mapped read-only, so pages
+        fault in on first access rather than being copied through a
+        deserializer; callers copy before mutating.
+
         Args:
-            filepath (Path): The file path to load from.
+            filepath (Path): The model file stem to load from.
 
         Returns:
             Optional[Dict[str, np.ndarray]]: A dictionary containing the loaded matrices, or None if unavailable.
         """
-        if not filepath.exists():
+        arrays: Dict[str, np.ndarray] = {}
+
+        try:
+            for name in _MODEL_ARRAYS:
+                array_path = self._array_path(filepath, name)
+                if not array_path.exists():
+                    return self._load_legacy_model(filepath)
+                arrays[name] = np.load(array_path, mmap_mode="r")
+        except Exception:
+            return None
+
+        return arrays
+
+    def _load_legacy_model(self, filepath: Path) -> Optional[Dict[str, np.ndarray]]:
+        """Loads a model saved in the pre-split single-archive format.
+
+        The oldest archives carry cov_inv rather than a Cholesky
+        factor; mu and cov are present in every format, so the factor
+        is rebuilt from cov when absent.
+
+        Args:
+            filepath (Path): The model file stem to load from.
+
+        Returns:
+            Optional[Dict[str, np.ndarray]]: The loaded matrices, or None if unavailable.
+        """
+        legacy_path = filepath.with_suffix(".npz")
+        if not legacy_path.exists():
             return None
 
         try:
-            with np.load(filepath) as data:
-                return {
-                    "mu": data["mu"],
-                    "cov": data["cov"],
-                    "cov_inv": data["cov_inv"],
-                }
+            with np.load(legacy_path) as data:
+                mu = np.asarray(data["mu"])
+                cov = np.asarray(data["cov"])
+
+                if "cov_L" in data:
+                    cov_L = np.asarray(data["cov_L"])
+                else:
+                    cov_L, _, _ = safe_cholesky(cov)
+
+                return {"mu": mu, "cov": cov, "cov_L": cov_L}
         except Exception:
             return None
 
@@ -66,8 +117,8 @@ class PersistenceManager:
         Args:
             state_dict (Dict[str, Any]): The dictionary of state variables to save.
         """
-        with atomic_write(self.state_file, mode="w") as f:
-            json.dump(state_dict, f, indent=4)
+        with atomic_write(self.state_file, mode="wb") as f:
+            f.write(orjson.dumps(state_dict, option=orjson.OPT_INDENT_2))
 
     def load_state(self) -> Dict[str, Any]:
         """Loads the JSON state file from disk.
@@ -79,7 +130,7 @@ class PersistenceManager:
             return {}
 
         try:
-            with open(self.state_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
+            with open(self.state_file, "rb") as f:
+                return orjson.loads(f.read())
+        except orjson.JSONDecodeError:
             return {}
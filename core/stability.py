@@ -5,6 +5,7 @@ Numerical stability routines for covariance matrices.
 import numpy as np
 
 from config import defaults
+from core._kernels_n7 import N_FEATURES, cholesky_n7
 
 DEFAULT_EPSILON = defaults.EPSILON_BASE
 MAX_CONDITION_NUMBER = defaults.CONDITION_NUMBER
@@ -22,50 +23,115 @@ def apply_regularization(
     Returns:
         np.ndarray: The regularized covariance matrix.
     """
-    return cov + np.eye(cov.shape[0]) * epsilon
+    out = cov.copy()
+    apply_regularization_inplace(out, epsilon)
+    return out
 
 
-def check_condition_number(cov: np.ndarray) -> float:
-    """Computes the condition number of a matrix.
+def apply_regularization_inplace(cov: np.ndarray, epsilon: float = DEFAULT_EPSILON):
+    """Adds epsilon to the diagonal of the covariance matrix in place.
+
+    Avoids the identity-matrix and sum allocations of the copying
+    variant for callers that discard the regularized matrix anyway.
+
+    Args:
+        cov (np.ndarray): The covariance matrix, mutated in place.
+        epsilon (float, optional): The regularization term. Defaults to DEFAULT_EPSILON.
+    """
+    cov[np.diag_indices_from(cov)] += epsilon
+
+
+def estimate_condition_number(factor: np.ndarray) -> float:
+    """Estimates the condition number from a Cholesky factor.
+
+    The squared ratio of the extreme diagonal entries of the factor is a
+    cheap surrogate for the spectral condition number that avoids the
+    full SVD performed by np.linalg.cond.
 
     Args:
-        cov (np.ndarray): The matrix to evaluate.
+        factor (np.ndarray): The triangular Cholesky factor.
 
     Returns:
-        float: The computed condition number, or infinity if singular.
+        float: The estimated condition number, or infinity if singular.
     """
+    diag = np.abs(np.diag(factor))
+    d_min = diag.min()
+
+    if d_min == 0.0:
+        return float("inf")
+
+    return float((diag.max() / d_min) ** 2)
+
+
+def _try_factor(reg_cov: np.ndarray) -> np.ndarray | None:
+    """Attempts a Cholesky factorization of a regularized matrix.
+
+    Uses the unrolled 7x7 kernel when the dimension matches and LAPACK
+    otherwise.
+
+    Args:
+        reg_cov (np.ndarray): The regularized covariance matrix.
+
+    Returns:
+        np.ndarray | None: The lower-triangular factor, or None if the matrix is not positive definite.
+    """
+    if reg_cov.shape[0] == N_FEATURES:
+        out = np.empty_like(reg_cov)
+        if cholesky_n7(reg_cov, out):
+            return out
+        return None
+
     try:
-        return np.linalg.cond(cov)
+        return np.linalg.cholesky(reg_cov)
     except np.linalg.LinAlgError:
-        return float("inf")
+        return None
 
 
-def safe_invert(
+def safe_cholesky(
     cov: np.ndarray, base_epsilon: float = DEFAULT_EPSILON
 ) -> tuple[np.ndarray, bool, float]:
-    """Attempts to safely invert the covariance matrix.
+    """Attempts to safely factorize the covariance matrix.
 
     Args:
-        cov (np.ndarray): The covariance matrix to invert.
+        cov (np.ndarray): The covariance matrix to factorize.
         base_epsilon (float, optional): The initial epsilon for regularization. Defaults to DEFAULT_EPSILON.
 
     Returns:
-        tuple[np.ndarray, bool, float]: A tuple containing the inverse matrix, a boolean freeze flag, and the applied epsilon.
+        tuple[np.ndarray, bool, float]: A tuple containing the lower-triangular Cholesky factor, a boolean freeze flag, and the applied epsilon.
     """
     current_eps = base_epsilon
     max_retries = 5
 
     for _ in range(max_retries):
         reg_cov = apply_regularization(cov, current_eps)
-        cond_num = check_condition_number(reg_cov)
+
+        factor = _try_factor(reg_cov)
+        if factor is None:
+            current_eps *= 10.0
+            continue
+
+        cond_num = estimate_condition_number(factor)
 
         if cond_num < MAX_CONDITION_NUMBER:
-            try:
-                inv_cov = np.linalg.inv(reg_cov)
-                return inv_cov, False, current_eps
-            except np.linalg.LinAlgError:
-                pass
+            return factor, False, current_eps
 
         current_eps *= 10.0
 
-    return np.linalg.pinv(apply_regularization(cov, base_epsilon)), True, base_epsilon
+    # Clamp the spectrum so a valid factor exists even when the matrix
+    # is numerically singular; the model freezes in this state. The
+    # floor must scale with the spectrum: an absolute base_epsilon is
+    # swamped by reconstruction noise when the eigenvalues span many
+    # orders of magnitude, leaving the rebuilt matrix indefinite.
+    vals, vecs = np.linalg.eigh(apply_regularization(cov, base_epsilon))
+    floor = max(base_epsilon, np.finfo(cov.dtype).eps * vals.max() * cov.shape[0])
+    vals = np.maximum(vals, floor)
+
+    try:
+        factor = np.linalg.cholesky((vecs * vals) @ vecs.T)
+    except np.linalg.LinAlgError:
+        # Even the clamped reconstruction can fail under extreme
+        # scale spread; a diagonal factor keeps the contract that a
+        # usable factor is always returned.
+        factor = np.diag(np.sqrt(np.maximum(np.diag(cov), floor)))
+
+    return factor, True, base_epsilon
@@ -4,23 +4,28 @@ Online updating logic for statistical measures.
 
 import numpy as np
 
+from core._kernels_n7 import N_FEATURES, rank1_update_n7
 
-def update_mean(mu_t: np.ndarray, x_t: np.ndarray, lambda_factor: float) -> np.ndarray:
+
+def update_mean(
+    mu_t: np.ndarray, x_t: np.ndarray, lambda_factor: float, one_minus_lambda: float
+) -> np.ndarray:
     """Computes the online mean update.
 
     Args:
         mu_t (np.ndarray): The previous mean vector.
         x_t (np.ndarray): The current incoming vector.
         lambda_factor (float): The exponential weighting factor.
+        one_minus_lambda (float): The precomputed complement 1 - lambda_factor.
 
     Returns:
         np.ndarray: The updated mean vector.
     """
-    return (1.0 - lambda_factor) * mu_t + lambda_factor * x_t
+    return one_minus_lambda * mu_t + lambda_factor * x_t
 
 
 def update_covariance(
-    cov_t: np.ndarray, mu_t: np.ndarray, x_t: np.ndarray, lambda_factor: float
+    cov_t: np.ndarray, mu_t: np.ndarray, x_t: np.ndarray, lambda_factor: float, one_minus_lambda: float
 ) -> np.ndarray:
     """Computes the online covariance update.
 
@@ -29,10 +34,18 @@ def update_covariance(
         mu_t (np.ndarray): The previous mean vector.
         x_t (np.ndarray): The current incoming vector.
         lambda_factor (float): The exponential weighting factor.
+        one_minus_lambda (float): The precomputed complement 1 - lambda_factor.
 
     Returns:
         np.ndarray: The updated covariance matrix.
     """
-    diff = (x_t - mu_t).reshape(-1, 1)
-    rank_one_update = diff @ diff.T
-    return (1.0 - lambda_factor) * cov_t + lambda_factor * rank_one_update
+    diff = x_t - mu_t
+
+    if diff.shape[0] == N_FEATURES:
+        out = cov_t.copy()
+        rank1_update_n7(out, diff, lambda_factor, one_minus_lambda)
+        return out
+
+    out = np.multiply(cov_t, one_minus_lambda, out=np.empty_like(cov_t))
+    out += lambda_factor * np.outer(diff, diff)
+    return out
@@ -0,0 +1,48 @@
+"""
+Numerically stable running statistics via Welford's algorithm.
+"""
+
+import numpy as np
+
+
+class WelfordAccumulator:
+    """Accumulates the mean and covariance of a stream one sample at a time."""
+
+    def __init__(self):
+        """Initializes an empty accumulator."""
+        self.n: int = 0
+        self.mu: np.ndarray | None = None
+        self._m2: np.ndarray | None = None
+
+    def update(self, x: np.ndarray):
+        """Folds one sample into the running statistics.
+
+        Args:
+            x (np.ndarray): The incoming feature vector.
+        """
+        if self.mu is None:
+            self.mu = np.zeros(x.size, dtype=np.float64)
+            self._m2 = np.zeros((x.size, x.size), dtype=np.float64)
+
+        self.n += 1
+        delta = x - self.mu
+        self.mu += delta / self.n
+        self._m2 += np.outer(delta, x - self.mu)
+
+    @property
+    def mean(self) -> np.ndarray | None:
+        """The running mean vector, or None before the first sample."""
+        return self.mu
+
+    @property
+    def covariance(self) -> np.ndarray | None:
+        """The sample covariance matrix, or None before the second sample."""
+        if self.n < 2:
+            return None
+        return self._m2 / (self.n - 1)
+
+    def reset(self):
+        """Clears the accumulated statistics."""
+        self.n = 0
+        self.mu = None
+        self._m2 = None
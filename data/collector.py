@@ -11,6 +11,8 @@ import psutil
 class SystemCollector:
     """Collects hardware and OS performance metrics."""
 
+    TEMP_REFRESH_TICKS = 5
+
     def __init__(self):
         """Initializes the collector and internal counters."""
         self.last_time = time.time()
@@ -20,6 +22,47 @@ class SystemCollector:
 
         psutil.cpu_percent()
 
+        self._tick = 0
+        self._sensor_key = self._resolve_sensor_key()
+        self._temp_cache = self._read_temperature()
+
+    def _resolve_sensor_key(self) -> str | None:
+        """Resolves the hwmon sensor key used for CPU temperature once.
+
+        Returns:
+            str | None: The sensor dictionary key, or None if no sensors exist.
+        """
+        try:
+            temps = psutil.sensors_temperatures()
+        except Exception:
+            return None
+
+        if not temps:
+            return None
+
+        if "coretemp" in temps:
+            return "coretemp"
+
+        return next(iter(temps))
+
+    def _read_temperature(self) -> float:
+        """Reads the CPU temperature from the resolved sensor.
+
+        Returns:
+            float: The current temperature, or 0.0 if unavailable.
+        """
+        if self._sensor_key is None:
+            return 0.0
+
+        try:
+            entries = psutil.sensors_temperatures().get(self._sensor_key)
+            if entries:
+                return entries[0].current
+        except Exception:
+            pass
+
+        return 0.0
+
     def collect(self) -> Dict[str, float]:
         """Samples system metrics to calculate rates.
 
@@ -49,16 +92,13 @@ class SystemCollector:
             "net_bytes_recv_rate": net_recv_rate,
         }
 
-        try:
-            temps = psutil.sensors_temperatures()
-            if temps and "coretemp" in temps:
-                metrics["cpu_temperature"] = temps["coretemp"][0].current
-            elif temps:
-                metrics["cpu_temperature"] = list(temps.values())[0][0].current
-            else:
-                metrics["cpu_temperature"] = 0.0
-        except Exception:
-            metrics["cpu_temperature"] = 0.0
+        # Temperatures change slowly; re-parsing hwmon every second is
+        # wasted syscall work, so serve a cached reading between refreshes.
+        self._tick += 1
+        if self._tick % self.TEMP_REFRESH_TICKS == 0:
+            self._temp_cache = self._read_temperature()
+
+        metrics["cpu_temperature"] = self._temp_cache
 
         self.last_time = current_time
         self.last_disk = current_disk
@@ -2,11 +2,12 @@
 Feature vector generation from raw metrics.
 """
 
+import operator
 from typing import Dict
 
 import numpy as np
 
-FEATURE_KEYS = [
+FEATURE_KEYS = (
     "cpu_percent",
     "ram_percent",
     "disk_read_rate",
@@ -14,7 +15,18 @@ FEATURE_KEYS = [
     "net_bytes_sent_rate",
     "net_bytes_recv_rate",
     "cpu_temperature",
-]
+)
+
+_N = len(FEATURE_KEYS)
+
+if _N > 10:
+    raise ValueError(f"Feature vector dimension {_N} exceeds maximum of 10.")
+
+# System metrics carry at most a few significant digits, so float32 is
+# plenty and halves the memory traffic downstream.
+_SCRATCH = np.zeros(_N, dtype=np.float32)
+
+_GETTER = operator.itemgetter(*FEATURE_KEYS)
 
 
 def build_feature_vector(metrics: Dict[str, float]) -> np.ndarray:
@@ -25,17 +37,15 @@ def build_feature_vector(metrics: Dict[str, float]) -> np.ndarray:
 
     Returns:
         np.ndarray: A feature vector representation of the metrics.
-
-    Raises:
-        ValueError: If the resulting feature vector exceeds dimension length 10.
     """
-    vector_data = []
-    for key in FEATURE_KEYS:
-        vector_data.append(metrics.get(key, 0.0))
-
-    x_t = np.array(vector_data, dtype=np.float64)
-
-    if len(x_t) > 10:
-        raise ValueError(f"Feature vector dimension {len(x_t)} exceeds maximum of 10.")
-
-    return x_t
+    try:
+        # The collector emits every feature key each tick, so a single
+        # C-level itemgetter fetch is the common case.
+        _SCRATCH[:] = _GETTER(metrics)
+    except KeyError:
+        for i, key in enumerate(FEATURE_KEYS):
+            _SCRATCH[i] = metrics.get(key, 0.0)
+
+    # Downstream consumers retain the vector, so hand out a copy of the
+    # scratch buffer rather than the buffer itself.
+    return _SCRATCH.copy()
@@ -21,6 +21,7 @@ class DataSmoother:
         """
         self.window_size = window_size
         self.window = RollingWindowMath(window_size=self.window_size)
+        self._warmed_up = False
 
     def process(self, raw_metrics: Dict[str, float]) -> np.ndarray | None:
         """Ingests raw metrics and applies the rolling mean if buffer is full.
@@ -35,7 +36,11 @@ class DataSmoother:
 
         self.window.append(x_raw)
 
-        if self.window.is_full():
-            return self.window.get_mean()
+        # The window never shrinks, so once full it stays full; cache
+        # that transition instead of re-asking every tick.
+        if not self._warmed_up:
+            if not self.window.is_full():
+                return None
+            self._warmed_up = True
 
-        return None
+        return self.window.get_mean()
@@ -4,6 +4,8 @@ Main entry point for the Sentinel application.
 
 import logging
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 
 from config import paths
 from monitor.app import run_application
@@ -12,26 +14,37 @@ from monitor.app import run_application
 def setup_main_logging():
     """Configures global logging for the Sentinel process.
 
+    Records are routed through a QueueHandler and drained to the file
+    and stdout by a background QueueListener, so log calls from the
+    engine thread cost an enqueue rather than synchronous disk I/O.
+
     Returns:
-        logging.Logger: The configured main logger instance.
+        tuple[logging.Logger, logging.handlers.QueueListener]: The main
+            logger and the started listener draining its queue.
     """
     paths.BASE_DIR.mkdir(parents=True, exist_ok=True)
     log_file = paths.BASE_DIR / "sentinel_main.log"
 
+    queue: SimpleQueue = SimpleQueue()
+    listener = QueueListener(
+        queue,
+        logging.FileHandler(str(log_file)),
+        logging.StreamHandler(sys.stdout),
+        respect_handler_level=True,
+    )
+    listener.start()
+
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - [%(levelname)s] - %(name)s: %(message)s",
-        handlers=[
-            logging.FileHandler(str(log_file)),
-            logging.StreamHandler(sys.stdout),
-        ],
+        handlers=[QueueHandler(queue)],
     )
-    return logging.getLogger("SentinelMain")
+    return logging.getLogger("SentinelMain"), listener
 
 
 def main():
     """Starts the Sentinel Application Pipeline."""
-    logger = setup_main_logging()
+    logger, listener = setup_main_logging()
     logger.info("==================================================")
     logger.info("Starting Sentinel Application Pipeline...")
     logger.info("==================================================")
@@ -44,6 +57,7 @@ def main():
         logger.error(f"Sentinel encountered a fatal crash: {e}", exc_info=True)
     finally:
         logger.info("Sentinel process terminated.")
+        listener.stop()
 
 
 if __name__ == "__main__":
@@ -3,14 +3,17 @@ Main application UI and process manager.
 """
 
 import os
+import socket
 import subprocess
 import sys
+import tempfile
 import time
 from typing import Any, Dict
 
-from PySide6.QtCore import Qt, QThread, Signal, Slot
+from PySide6.QtCore import Qt, QThread, QTimer, QUrl
 from PySide6.QtGui import QIcon, QKeySequence, QShortcut
-from PySide6.QtNetwork import QLocalServer, QLocalSocket
+from PySide6.QtMultimedia import QSoundEffect
+from PySide6.QtNetwork import QLocalServer
 from PySide6.QtWidgets import (
     QApplication,
     QComboBox,
@@ -32,14 +35,15 @@ from services.scheduler import EngineScheduler
 class EngineWorker(QThread):
     """Hosts the SentinelEngine and Scheduler in a background QThread."""
 
-    data_emitted = Signal(dict)
-
     def __init__(self):
-        """Initializes the engine worker thread."""
+        """Initializes the engine worker thread.
+
+        The engine publishes its latest state on engine.ui_state; the
+        window polls that on a timer, so the tick thread never runs any
+        UI dispatch work.
+        """
         super().__init__()
-        self.engine = SentinelEngine(
-            ui_callback=lambda data: self.data_emitted.emit(data)
-        )
+        self.engine = SentinelEngine()
         self.scheduler = EngineScheduler(tick_callback=self.engine.tick, hz=1.0)
 
     def run(self):
@@ -67,27 +71,29 @@ class SentinelMainWindow(QMainWindow):
         self.setCentralWidget(self.central_widget)
         self.layout = QVBoxLayout(self.central_widget)
 
-        self.status_label = QLabel("Initializing...")
-        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        # One rich-text label carries both the status line and the
+        # metrics line, so a tick repaints a single widget at most.
+        self.info_label = QLabel()
+        self.info_label.setTextFormat(Qt.TextFormat.RichText)
+        self.info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._status_html = "<span style='font-size:18px; font-weight:bold;'>Initializing...</span>"
+        self._metrics_html = "Waiting for data..."
+        self.info_label.setText(f"{self._status_html}<br/>{self._metrics_html}")
 
         self.progress_bar = QProgressBar()
         self.progress_bar.hide()
 
-        self.metrics_label = QLabel("Waiting for data...")
         self.plotter = RealTimePlotter(max_points=600)
 
-        self.layout.addWidget(self.status_label)
+        self.layout.addWidget(self.info_label)
         self.layout.addWidget(self.progress_bar)
-        self.layout.addWidget(self.metrics_label)
         self.layout.addWidget(self.plotter)
 
         self.retrain_layout = QHBoxLayout()
 
         self.retrain_combo = QComboBox()
-        self.retrain_combo.addItems(
-            ["5 Minutes", "10 Minutes", "30 Minutes", "60 Minutes"]
-        )
+        for minutes in (5, 10, 30, 60):
+            self.retrain_combo.addItem(f"{minutes} Minutes", minutes * 60)
         self.retrain_combo.setCurrentIndex(1)
 
         self.btn_retrain = QPushButton("Retrain Baseline")
@@ -119,11 +125,30 @@ class SentinelMainWindow(QMainWindow):
         self.server.newConnection.connect(self.handle_wake_up)
 
         self.worker = EngineWorker()
-        self.worker.data_emitted.connect(self.update_ui)
         self.worker.start()
 
+        # Poll at twice the tick rate so a fresh state is picked up
+        # within half a tick; already-rendered sequence numbers are
+        # skipped (the engine mutates one payload dict in place).
+        self._last_seq = 0
+        self._ui_poll_timer = QTimer(self)
+        self._ui_poll_timer.timeout.connect(self._poll_engine_state)
+        self._ui_poll_timer.start(500)
+
         self._is_force_quitting = False
         self.last_alarm_time = 0.0
+        self._last_mode = None
+        self._last_status_key = None
+        self._last_metrics_key = None
+
+        # QSoundEffect only decodes WAV, so keep the fork/exec chain as
+        # fallback when no uncompressed sample is available.
+        self._alarm_effect = None
+        alarm_wav = "/usr/share/sounds/alsa/Front_Center.wav"
+        if os.path.exists(alarm_wav):
+            self._alarm_effect = QSoundEffect(self)
+            self._alarm_effect.setSource(QUrl.fromLocalFile(alarm_wav))
+            self._alarm_effect.setLoopCount(1)
 
         self.shortcut_a = QShortcut(QKeySequence(Qt.Key.Key_A), self)
         self.shortcut_a.activated.connect(self.plotter.plot_widget.enableAutoRange)
@@ -141,38 +166,57 @@ class SentinelMainWindow(QMainWindow):
         socket.disconnectFromServer()
 
     def start_custom_retraining(self):
-        """Translates the dropdown selection into seconds and triggers the engine."""
-        text = self.retrain_combo.currentText()
-        minutes = int(text.split()[0])
-        seconds = minutes * 60
+        """Reads the selected duration off the combo item and triggers the engine."""
+        seconds = self.retrain_combo.currentData()
 
         self.worker.engine.trigger_retraining(seconds)
 
-    @Slot(dict)
+    def _poll_engine_state(self):
+        """Picks up the engine's latest published state on the UI thread."""
+        state = self.worker.engine.ui_state
+        if state is None or state["seq"] == self._last_seq:
+            return
+
+        self._last_seq = state["seq"]
+        self.update_ui(state)
+
     def update_ui(self, state: Dict[str, Any]):
-        """Runs on the Main UI Thread, triggered by the background worker.
+        """Runs on the Main UI Thread, fed by the state poll timer.
 
         Args:
             state (Dict[str, Any]): A dictionary containing the UI update payload.
         """
         mode = state.get("mode")
 
+        # show/hide trigger a full layout pass even when the widget is
+        # already in the target state, so only toggle on transitions.
+        mode_changed = mode != self._last_mode
+        self._last_mode = mode
+
         if mode == "training":
-            self.progress_bar.show()
-            self.plotter.hide()
-            self.btn_retrain.setEnabled(False)
+            if mode_changed:
+                self.progress_bar.show()
+                self.plotter.hide()
+                self.btn_retrain.setEnabled(False)
+            if mode_changed:
+                self.info_label.setStyleSheet(
+                    "color: white; background-color: #004080;"
+                )
             self.progress_bar.setMaximum(state["target"])
             self.progress_bar.setValue(state["progress"])
-            self.status_label.setText(
+            self._status_html = (
+                "<span style='font-size:18px; font-weight:bold;'>"
                 f"Training Mode: Gathering Baseline ({state['progress']}/{state['target']}s)"
+                "</span>"
             )
-            self.status_label.setStyleSheet(
-                "font-size: 18px; font-weight: bold; color: white; background-color: #004080;"
-            )
+            self.info_label.setText(f"{self._status_html}<br/>{self._metrics_html}")
 
         elif mode == "monitoring":
-            self.progress_bar.hide()
-            self.plotter.show()
+            if mode_changed:
+                self.progress_bar.hide()
+                self.plotter.show()
+                self.btn_retrain.setEnabled(True)
+                self.info_label.setStyleSheet("")
 
             status = state["status"]
             severity = state["severity"]
@@ -184,17 +228,50 @@ class SentinelMainWindow(QMainWindow):
                     self._play_linux_alarm()
                     self.last_alarm_time = current_time
 
-            self.status_label.setText(
-                f"Status: {status} | Severity: {severity:.2f} | Risk: {risk:.2f}"
-            )
+            # Fixed-point ints double as the dirty key and sidestep the
+            # locale-aware float formatting path on the UI thread.
+            s_i = int(severity * 100)
+            r_i = int(risk * 100)
+            status_key = (status, s_i, r_i)
+            status_dirty = status_key != self._last_status_key
+            if status_dirty:
+                self._status_html = (
+                    "<span style='font-size:18px; font-weight:bold;'>"
+                    f"Status: {status}"
+                    f" | Severity: {s_i // 100}.{s_i % 100:02d}"
+                    f" | Risk: {r_i // 100}.{r_i % 100:02d}"
+                    "</span>"
+                )
+                self._last_status_key = status_key
+
             self.plotter.update_plot(severity, risk)
 
             metrics = state["metrics"]
-            m_text = f"CPU: {metrics['cpu_percent']}% | RAM: {metrics['ram_percent']}% | CPU Temp: {metrics.get('cpu_temperature', 0.0)}°C"
-            self.metrics_label.setText(m_text)
+            metrics_key = (
+                metrics["cpu_percent"],
+                metrics["ram_percent"],
+                metrics.get("cpu_temperature", 0.0),
+            )
+            metrics_dirty = metrics_key != self._last_metrics_key
+            if metrics_dirty:
+                self._metrics_html = (
+                    f"CPU: {metrics_key[0]}% | RAM: {metrics_key[1]}%"
+                    f" | CPU Temp: {metrics_key[2]}°C"
+                )
+                self._last_metrics_key = metrics_key
+
+            if status_dirty or metrics_dirty:
+                self.info_label.setText(
+                    f"{self._status_html}<br/>{self._metrics_html}"
+                )
 
     def _play_linux_alarm(self):
         """Attempts to play a native Linux warning sound without blocking the UI."""
+        if self._alarm_effect is not None:
+            # Persistent in-process player: no fork/exec per alarm.
+            self._alarm_effect.play()
+            return
+
         try:
             subprocess.Popen(
                 ["paplay", "/usr/share/sounds/freedesktop/stereo/dialog-warning.oga"],
@@ -234,8 +311,33 @@ class SentinelMainWindow(QMainWindow):
         QApplication.quit()
 
 
+def _wake_running_instance() -> bool:
+    """Probes the singleton IPC endpoint and wakes an existing daemon.
+
+    Uses a plain Unix-domain socket against the path QLocalServer binds
+    on Linux, so the "already running" case is decided before any Qt
+    GUI machinery (plugin load, theme parse, font scan) is paid for.
+
+    Returns:
+        bool: True if a running instance was found and woken.
+    """
+    endpoint = os.path.join(tempfile.gettempdir(), "sentinel_ipc")
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.settimeout(0.5)
+            probe.connect(endpoint)
+            probe.sendall(b"wake")
+        return True
+    except OSError:
+        return False
+
+
 def run_application():
     """Initializes and runs the PyQt application."""
+    if _wake_running_instance():
+        print("Sentinel daemon is already running. Waking it up...")
+        sys.exit(0)
+
     app = QApplication(sys.argv)
     app.setApplicationName("Sentinel")
     app.setDesktopFileName("sentinel.desktop")
@@ -250,15 +352,6 @@ def run_application():
     else:
         print(f"Warning: Icon not found at {icon_path}")
 
-    socket = QLocalSocket()
-    socket.connectToServer("sentinel_ipc")
-    if socket.waitForConnected(500):
-        print("Sentinel daemon is already running. Waking it up...")
-        socket.write(b"wake")
-        socket.flush()
-        socket.disconnectFromServer()
-        sys.exit(0)
-
     window = SentinelMainWindow()
     window.show()
 
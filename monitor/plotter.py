@@ -4,12 +4,15 @@ Real-time plotting UI component.
 
 import numpy as np
 import pyqtgraph as pg
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QVBoxLayout, QWidget
 
 
 class RealTimePlotter(QWidget):
     """UI widget for real-time visualization of risk and severity."""
 
+    REPAINT_INTERVAL_MS = 100
+
     def __init__(self, max_points: int = 600):
         """Initializes the plotter widget.
 
@@ -29,32 +32,68 @@ class RealTimePlotter(QWidget):
 
         self.layout.addWidget(self.plot_widget)
 
-        self.time_data = np.arange(-max_points, 0, dtype=float)
-        self.severity_data = np.zeros(max_points, dtype=float)
-        self.risk_data = np.zeros(max_points, dtype=float)
+        # The x axis is fixed for the lifetime of the widget; freezing it
+        # lets both curves share one reference with no defensive copies.
+        self.time_data = np.arange(-max_points, 0, dtype=np.float32)
+        self.time_data.setflags(write=False)
+        self.severity_data = np.zeros(max_points, dtype=np.float32)
+        self.risk_data = np.zeros(max_points, dtype=np.float32)
+        self._head = 0
 
         self.severity_curve = self.plot_widget.plot(
             self.time_data,
             self.severity_data,
             pen=pg.mkPen("b", width=2),
             name="Severity (S)",
+            connect="all",
         )
         self.risk_curve = self.plot_widget.plot(
-            self.time_data, self.risk_data, pen=pg.mkPen("r", width=2), name="Risk"
+            self.time_data,
+            self.risk_data,
+            pen=pg.mkPen("r", width=2),
+            name="Risk",
+            connect="all",
         )
 
+        self._dirty = False
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.timeout.connect(self._flush_curves)
+        self._repaint_timer.start(self.REPAINT_INTERVAL_MS)
+
+    def _ordered(self, buf: np.ndarray) -> np.ndarray:
+        """Returns a ring buffer rearranged into chronological order.
+
+        Args:
+            buf (np.ndarray): The circular data buffer.
+
+        Returns:
+            np.ndarray: The buffer contents ordered oldest to newest.
+        """
+        if self._head == 0:
+            return buf
+        return np.concatenate((buf[self._head :], buf[: self._head]))
+
     def update_plot(self, severity: float, risk: float):
-        """Rolls the buffers and updates the plot curves.
+        """Writes the new samples into the ring buffers and marks them dirty.
+
+        The actual setData calls happen on the repaint timer, so bursts
+        of updates coalesce into one curve rebuild per frame.
 
         Args:
             severity (float): The incoming severity value.
             risk (float): The incoming risk value.
         """
-        self.severity_data[:-1] = self.severity_data[1:]
-        self.severity_data[-1] = severity
+        self.severity_data[self._head] = severity
+        self.risk_data[self._head] = risk
+        self._head = (self._head + 1) % self.max_points
+
+        self._dirty = True
 
-        self.risk_data[:-1] = self.risk_data[1:]
-        self.risk_data[-1] = risk
+    def _flush_curves(self):
+        """Pushes the chronologically ordered buffers to the curves if dirty."""
+        if not self._dirty:
+            return
 
-        self.severity_curve.setData(self.time_data, self.severity_data)
-        self.risk_curve.setData(self.time_data, self.risk_data)
+        self.severity_curve.setData(self.time_data, self._ordered(self.severity_data))
+        self.risk_curve.setData(self.time_data, self._ordered(self.risk_data))
+        self._dirty = False
@@ -2,19 +2,23 @@
 Core engine service managing data collection, model updating, and anomaly detection.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Callable, Dict, Optional
 
 import numpy as np
 
 from config import defaults
-from core.anomaly import RiskAccumulator, calculate_severity
+from core._fastpath import monitor_step
+from core.anomaly import RiskAccumulator
 from core.contamination import is_contaminated
-from core.drift import DriftDetector, calculate_divergence
+from core.drift import DriftDetector
 from core.model import StatisticalModel
 from core.persistence import PersistenceManager
+from core.welford import WelfordAccumulator
 from data.collector import SystemCollector
 from data.smoothing import DataSmoother
-from services.logger import logger
+from services.logger import logger, stop_listener
+from utils.math_utils import calculate_mahalanobis_batch
 
 
 class SentinelEngine:
@@ -24,7 +28,7 @@ class SentinelEngine:
         """Initializes the Sentinel engine with its component subsystems.
 
         Args:
-            ui_callback (Optional[Callable[[Dict[str, Any]], None]], optional): Callback function to send state updates to the UI. Defaults to None.
+            ui_callback (Optional[Callable[[Dict[str, Any]], None]], optional): Callback invoked with state updates on the tick thread; prefer polling ui_state instead. Defaults to None.
         """
         self.collector = SystemCollector()
         self.smoother = DataSmoother(window_size=5)
@@ -37,15 +41,59 @@ class SentinelEngine:
         self.risk_accumulator = RiskAccumulator(
             alert_threshold=defaults.RISK_ALERT_THRESHOLD
         )
+        # Cached so the hot loop skips the module-attribute lookup.
+        self._contamination_limit = defaults.CONTAMINATION_LIMIT
         self.drift_detector = DriftDetector(
-            k=defaults.CUSUM_K, threshold=defaults.CUSUM_THRESHOLD
+            k=defaults.CUSUM_K,
+            threshold=defaults.CUSUM_THRESHOLD,
+            check_every=defaults.CUSUM_CHECK_EVERY,
         )
 
         self.persistence = PersistenceManager()
         self.ui_callback = ui_callback
 
+        # Latest published state; a plain reference swap, so consumers
+        # on other threads can poll it without a lock and the tick
+        # thread never blocks on UI work. The two payload dicts are
+        # preallocated and mutated in place each tick — consumers must
+        # read "seq" for freshness and must not retain the dict.
+        self.ui_state: Dict[str, Any] | None = None
+        self._ui_seq = 0
+        self._ui_payload_train: Dict[str, Any] = {
+            "mode": "training",
+            "seq": 0,
+            "progress": 0,
+            "target": 0,
+            "metrics": None,
+        }
+        self._ui_payload_mon: Dict[str, Any] = {
+            "mode": "monitoring",
+            "seq": 0,
+            "metrics": None,
+            "severity": 0.0,
+            "risk": 0.0,
+            "status": "",
+            "divergence": 0.0,
+            "is_frozen": False,
+        }
+
+        # Starts past the post-drift recovery window; reset to 0 when
+        # CUSUM synchronizes the short model onto the long one.
+        self._ticks_since_drift = 2
+
+        # Single worker keeps checkpoint writes ordered while taking the
+        # write+fsync+rename latency off the tick thread.
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="SentinelIO"
+        )
+        self._pending_save: Future | None = None
+
         self.training_target = defaults.DEFAULT_TRAINING_SECONDS
-        self.training_buffer = []
+        # Preallocated (target, d) matrix, sized lazily once the first
+        # smoothed vector reveals the feature dimension.
+        self.training_buffer: np.ndarray | None = None
+        self._buf_idx = 0
+        self.training_stats = WelfordAccumulator()
         self.is_training = True
 
         self._attempt_load_state()
@@ -57,15 +105,18 @@ class SentinelEngine:
         system_state = self.persistence.load_state()
 
         if short_state and long_state and "threshold" in system_state:
-            self.model_short.mu = short_state["mu"]
-            self.model_short.cov = short_state["cov"]
-            self.model_short.cov_inv = short_state["cov_inv"]
+            # np.array detaches the read-only load-time memmaps into
+            # writable float32 buffers (old float64 checkpoints are cast
+            # in the same step).
+            self.model_short.mu = np.array(short_state["mu"], dtype=np.float32)
+            self.model_short.cov = np.array(short_state["cov"], dtype=np.float32)
+            self.model_short.cov_L = np.array(short_state["cov_L"], dtype=np.float32)
             self.model_short.threshold = system_state["threshold"]
             self.model_short.is_initialized = True
 
-            self.model_long.mu = long_state["mu"]
-            self.model_long.cov = long_state["cov"]
-            self.model_long.cov_inv = long_state["cov_inv"]
+            self.model_long.mu = np.array(long_state["mu"], dtype=np.float32)
+            self.model_long.cov = np.array(long_state["cov"], dtype=np.float32)
+            self.model_long.cov_L = np.array(long_state["cov_L"], dtype=np.float32)
             self.model_long.threshold = system_state["threshold"]
             self.model_long.is_initialized = True
 
@@ -96,29 +147,45 @@ class SentinelEngine:
             x_t (np.ndarray): The smoothed feature vector.
             raw_metrics (Dict[str, float]): The raw collected metrics.
         """
-        self.training_buffer.append(x_t)
-        progress = len(self.training_buffer)
+        if (
+            self.training_buffer is None
+            or self.training_buffer.shape[0] != self.training_target
+        ):
+            self.training_buffer = np.empty(
+                (self.training_target, x_t.size), dtype=np.float32
+            )
+            self._buf_idx = 0
+
+        self.training_buffer[self._buf_idx] = x_t
+        self._buf_idx += 1
+        self.training_stats.update(x_t)
+        progress = self._buf_idx
 
         if progress >= self.training_target:
             logger.info("Training complete. Initializing models...")
-            batch_data = np.array(self.training_buffer)
+            batch_data = self.training_buffer[: self._buf_idx]
+            mu = self.training_stats.mean
+            cov = self.training_stats.covariance
 
-            self.model_short.initialize_from_batch(batch_data)
-            self.model_long.initialize_from_batch(batch_data)
+            self.model_short.initialize_from_moments(mu, cov, batch_data)
+            self.model_long.initialize_from_moments(mu, cov, batch_data)
 
             self._save_all_state()
-            self.training_buffer.clear()
+            self._buf_idx = 0
+            self.training_stats.reset()
             self.is_training = False
 
+        self._ui_seq += 1
+        state = self._ui_payload_train
+        state["progress"] = progress
+        state["target"] = self.training_target
+        state["metrics"] = raw_metrics
+        # seq is stored last: the UI poller treats a seq change as proof
+        # the other fields are complete, and it reads from another thread.
+        state["seq"] = self._ui_seq
+        self.ui_state = state
         if self.ui_callback:
-            self.ui_callback(
-                {
-                    "mode": "training",
-                    "progress": progress,
-                    "target": self.training_target,
-                    "metrics": raw_metrics,
-                }
-            )
+            self.ui_callback(state)
 
     def _handle_monitoring(self, x_t: np.ndarray, raw_metrics: Dict[str, float]):
         """Evaluates incoming data against models and updates them online.
@@ -127,11 +194,23 @@ class SentinelEngine:
             x_t (np.ndarray): The smoothed feature vector.
             raw_metrics (Dict[str, float]): The raw collected metrics.
         """
-        severity = calculate_severity(
-            x_t, self.model_long.mu, self.model_long.cov_inv, self.model_long.threshold
+        # Locals shave the repeated self.* attribute chains off the
+        # per-tick bytecode.
+        model_long = self.model_long
+        model_short = self.model_short
+        risk_acc = self.risk_accumulator
+
+        severity, risk_val, is_anomaly, divergence = monitor_step(
+            x_t,
+            model_long.mu,
+            model_long.cov_L,
+            model_long.inv_threshold,
+            risk_acc.risk,
+            risk_acc.alert_threshold,
+            model_short.mu,
         )
+        risk_acc.risk = risk_val
 
-        risk_val, is_anomaly = self.risk_accumulator.update(severity)
         if is_anomaly:
             logger.warning(
                 f"ANOMALY DETECTED! Risk: {risk_val:.2f}, Severity: {severity:.2f}"
@@ -140,33 +219,90 @@ class SentinelEngine:
         is_drift = self.drift_detector.update_cusum(severity)
         if is_drift:
             logger.info("System Drift Detected via CUSUM. Adjusting short-term model.")
-            self.model_short.mu = self.model_long.mu.copy()
-            self.model_short.cov = self.model_long.cov.copy()
-            self.model_short.cov_inv = self.model_long.cov_inv.copy()
+            # Overwrite the short model's existing arrays in place
+            # rather than allocating three fresh copies per drift event.
+            np.copyto(model_short.mu, model_long.mu)
+            np.copyto(model_short.cov, model_long.cov)
+            np.copyto(model_short.cov_L, model_long.cov_L)
+            self._ticks_since_drift = 0
+            divergence = 0.0
+        elif self._ticks_since_drift < 2:
+            # The means were just synchronized; any measured divergence
+            # is float noise until both models have taken an update.
+            self._ticks_since_drift += 1
+            divergence = 0.0
+
+        if not is_contaminated(severity, severity_limit=self._contamination_limit):
+            self._dual_update(x_t, severity)
+
+        status = (
+            "🔴 Anomaly"
+            if is_anomaly
+            else ("🟡 Elevated" if risk_val > 5.0 else "🟢 Normal")
+        )
+        self._ui_seq += 1
+        state = self._ui_payload_mon
+        state["metrics"] = raw_metrics
+        state["severity"] = severity
+        state["risk"] = risk_val
+        state["status"] = status
+        state["divergence"] = divergence
+        state["is_frozen"] = model_long.is_frozen
+        # seq is stored last: the UI poller treats a seq change as proof
+        # the other fields are complete, and it reads from another thread.
+        state["seq"] = self._ui_seq
+        self.ui_state = state
+        if self.ui_callback:
+            self.ui_callback(state)
 
-        divergence = calculate_divergence(self.model_short.mu, self.model_long.mu)
+    def _dual_update(self, x_t: np.ndarray, severity: float):
+        """Runs both models' EWMA updates back-to-back.
 
-        if not is_contaminated(severity, severity_limit=defaults.CONTAMINATION_LIMIT):
-            self.model_short.update(x_t, severity)
-            self.model_long.update(x_t, severity)
+        Keeping the two updates adjacent lets them reuse x_t while it is
+        still cache-hot; each model carries its own precomputed
+        (1 - lambda) prefactor, so the per-tick path is pure BLAS.
 
-        if self.ui_callback:
-            status = (
-                "🔴 Anomaly"
-                if is_anomaly
-                else ("🟡 Elevated" if risk_val > 5.0 else "🟢 Normal")
-            )
-            self.ui_callback(
-                {
-                    "mode": "monitoring",
-                    "metrics": raw_metrics,
-                    "severity": severity,
-                    "risk": risk_val,
-                    "status": status,
-                    "divergence": divergence,
-                    "is_frozen": self.model_long.is_frozen,
-                }
-            )
+        Args:
+            x_t (np.ndarray): The smoothed feature vector.
+            severity (float): The anomaly severity of the vector.
+        """
+        self.model_short.update(x_t, severity)
+        self.model_long.update(x_t, severity)
+
+    def replay(self, batch_xt: np.ndarray) -> np.ndarray:
+        """Replays a batch of feature vectors through the monitoring math.
+
+        Vectorized counterpart of the per-tick path for offline replay:
+        severities for the whole batch come from one triangular solve,
+        contamination is a boolean mask, and the models are rebuilt once
+        from the clean subset instead of stepping the EWMA recursions
+        sample by sample.
+
+        Args:
+            batch_xt (np.ndarray): The (n, d) matrix of feature vectors.
+
+        Returns:
+            np.ndarray: The per-sample severities.
+
+        Raises:
+            ValueError: If the models have not been initialized yet.
+        """
+        if not self.model_long.is_initialized:
+            raise ValueError("replay requires initialized models.")
+
+        distances = calculate_mahalanobis_batch(
+            batch_xt, self.model_long.mu, self.model_long.cov_L
+        )
+        severities = distances * self.model_long.inv_threshold
+
+        clean = batch_xt[severities < defaults.CONTAMINATION_LIMIT]
+        # Rebuild the baselines once from the uncontaminated subset,
+        # provided it can support a covariance estimate.
+        if clean.shape[0] > clean.shape[1]:
+            self.model_short.initialize_from_batch(clean)
+            self.model_long.initialize_from_batch(clean)
+
+        return severities
 
     def trigger_retraining(self, target_seconds: int):
         """Forces the system to discard the current models and enter training mode.
@@ -174,12 +310,11 @@ class SentinelEngine:
         Args:
             target_seconds (int): Number of ticks to remain in training mode.
         """
-        from services.logger import (
-            logger,
-        )
-
         self.training_target = target_seconds
-        self.training_buffer.clear()
+        # The buffer is resized lazily on the next training tick if the
+        # new target differs from its current capacity.
+        self._buf_idx = 0
+        self.training_stats.reset()
 
         self.model_short.is_initialized = False
         self.model_long.is_initialized = False
@@ -189,25 +324,71 @@ class SentinelEngine:
         logger.info(f"Manual retraining triggered for {target_seconds} seconds.")
 
     def _save_all_state(self):
-        """Persists the mathematical models and scalar states to disk."""
-        self.persistence.save_model(
-            self.persistence.short_model_file,
-            self.model_short.mu,
-            self.model_short.cov,
-            self.model_short.cov_inv,
+        """Persists the mathematical models and scalar states to disk.
+
+        Snapshots the model arrays on the calling thread, then hands the
+        actual writes to the background I/O worker. A save still queued
+        from a previous call is cancelled, since the new snapshot
+        supersedes it.
+        """
+        short_snap = (
+            self.model_short.mu.copy(),
+            self.model_short.cov.copy(),
+            self.model_short.cov_L.copy(),
         )
-        self.persistence.save_model(
-            self.persistence.long_model_file,
-            self.model_long.mu,
-            self.model_long.cov,
-            self.model_long.cov_inv,
+        long_snap = (
+            self.model_long.mu.copy(),
+            self.model_long.cov.copy(),
+            self.model_long.cov_L.copy(),
         )
-        self.persistence.save_state(
-            {"threshold": self.model_long.threshold, "risk": self.risk_accumulator.risk}
+        state_snap = {
+            "threshold": self.model_long.threshold,
+            "risk": self.risk_accumulator.risk,
+        }
+
+        if self._pending_save is not None:
+            self._pending_save.cancel()
+
+        self._pending_save = self._io_executor.submit(
+            self._write_snapshots, short_snap, long_snap, state_snap
         )
+        self._pending_save.add_done_callback(self._report_save_result)
+
+    def _report_save_result(self, future: Future):
+        """Logs checkpoint failures that would otherwise die in the Future.
+
+        Args:
+            future (Future): The completed checkpoint-write future.
+        """
+        if future.cancelled():
+            return
+
+        exc = future.exception()
+        if exc is not None:
+            logger.error(f"State checkpoint failed: {exc}", exc_info=exc)
+
+    def _write_snapshots(self, short_snap, long_snap, state_snap):
+        """Writes snapshotted model and scalar state on the I/O worker.
+
+        Args:
+            short_snap (tuple): The (mu, cov, cov_L) copies for the short model.
+            long_snap (tuple): The (mu, cov, cov_L) copies for the long model.
+            state_snap (dict): The scalar state dictionary.
+        """
+        self.persistence.save_model(self.persistence.short_model_file, *short_snap)
+        self.persistence.save_model(self.persistence.long_model_file, *long_snap)
+        self.persistence.save_state(state_snap)
 
     def shutdown(self):
         """Saves current state upon application shutdown."""
         if not self.is_training:
             self._save_all_state()
+
+        # Blocks until any queued checkpoint finishes writing.
+        self._io_executor.shutdown(wait=True)
+
+        if not self.is_training:
             logger.info("Sentinel shutting down. State saved.")
+
+        # Flush any queued log records before the process exits.
+        stop_listener()
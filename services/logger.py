@@ -2,20 +2,34 @@
 Logger configuration service.
 """
 
+import functools
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 
 from config import paths
 
+# Listener draining the log queue to disk; stopped by the engine on
+# shutdown so buffered records are flushed.
+listener: QueueListener | None = None
 
+
+@functools.lru_cache(maxsize=1)
 def setup_logger(log_dir: str = "~/.sentinel") -> logging.Logger:
     """Configures the background logger for the Sentinel engine.
 
+    Records are enqueued on a lock-free SimpleQueue and written to the
+    log file by a QueueListener thread, so logging from tick() costs an
+    enqueue rather than a synchronous disk write.
+
     Args:
         log_dir (str, optional): The directory for the log file. Defaults to "~/.sentinel".
 
     Returns:
         logging.Logger: The configured logger instance.
     """
+    global listener
+
     paths.BASE_DIR.mkdir(parents=True, exist_ok=True)
 
     logger = logging.getLogger("SentinelEngine")
@@ -25,9 +39,23 @@ def setup_logger(log_dir: str = "~/.sentinel") -> logging.Logger:
         file_handler = logging.FileHandler(paths.LOG_FILE)
         formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+
+        queue: SimpleQueue = SimpleQueue()
+        logger.addHandler(QueueHandler(queue))
+
+        listener = QueueListener(queue, file_handler, respect_handler_level=True)
+        listener.start()
 
     return logger
 
 
+def stop_listener():
+    """Stops the queue listener, flushing any buffered records."""
+    global listener
+
+    if listener is not None:
+        listener.stop()
+        listener = None
+
+
 logger = setup_logger()
@@ -41,17 +41,26 @@ class EngineScheduler:
             self._thread.join(timeout=2.0)
 
     def _run_loop(self):
-        """Executes the precision timing loop."""
-        while not self._stop_event.is_set():
-            start_time = time.monotonic()
+        """Executes the precision timing loop.
+
+        Ticks are pinned to an absolute deadline grid: each iteration
+        advances the deadline by one interval and sleeps until it, so
+        wakeup jitter in one tick does not bleed into the next. After a
+        stall longer than one interval the grid is re-anchored to now
+        rather than firing a burst of catch-up ticks.
+        """
+        deadline = time.monotonic()
 
+        while not self._stop_event.is_set():
             try:
                 self.tick_callback()
             except Exception:
                 traceback.print_exc()
 
-            elapsed = time.monotonic() - start_time
-            sleep_time = self.interval - elapsed
+            deadline += self.interval
+            remaining = deadline - time.monotonic()
 
-            if sleep_time > 0:
-                self._stop_event.wait(sleep_time)
+            if remaining > 0:
+                self._stop_event.wait(remaining)
+            else:
+                deadline = time.monotonic()
@@ -3,10 +3,18 @@ Utility for atomic file writing.
 """
 
 import contextlib
+import itertools
 import os
-import tempfile
 from pathlib import Path
 
+# Parent directories already created by a previous write; checkpoints
+# hit the same few directories repeatedly, so the mkdir runs once each.
+_prepared_dirs: set[Path] = set()
+
+# Counter-based temp names avoid mkstemp's entropy draw; pid plus
+# counter keeps them unique across processes and within this one.
+_temp_counter = itertools.count()
+
 
 @contextlib.contextmanager
 def atomic_write(filepath: str | Path, mode: str = "w", encoding: str | None = "utf-8"):
@@ -24,17 +32,26 @@ def atomic_write(filepath: str | Path, mode: str = "w", encoding: str | None = "
         Exception: Re-raises any exception encountered during the file write.
     """
     path = Path(filepath)
-    path.parent.mkdir(parents=True, exist_ok=True)
+    parent = path.parent
+    if parent not in _prepared_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        _prepared_dirs.add(parent)
 
-    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".tmp_{path.name}_")
+    temp_path = parent / f".tmp_{path.name}_{os.getpid()}_{next(_temp_counter)}"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
 
     try:
         if "b" in mode:
-            with open(fd, mode) as f:
-                yield f
+            f = open(fd, mode)
         else:
-            with open(fd, mode, encoding=encoding) as f:
-                yield f
+            f = open(fd, mode, encoding=encoding)
+
+        with f:
+            yield f
+            # fdatasync persists the data without forcing the inode
+            # metadata journal write that a full fsync would.
+            f.flush()
+            os.fdatasync(f.fileno())
 
         os.replace(temp_path, path)
     except Exception as e:
@@ -2,26 +2,109 @@
 General mathematical and statistical utilities.
 """
 
-from collections import deque
-
 import numpy as np
+from numba import njit
+
+# Explicit signature so the kernel compiles at import time rather than
+# stalling the first tick.
+@njit(
+    [
+        "int64(float32[:, ::1], float32[::1], int64, boolean, float32[::1])",
+        "int64(float64[:, ::1], float64[::1], int64, boolean, float64[::1])",
+    ],
+    cache=True,
+    fastmath=True,
+    boundscheck=False,
+)
+def _roll_update(
+    buf: np.ndarray, sums: np.ndarray, head: int, full: bool, x: np.ndarray
+) -> int:
+    """Writes one vector into the ring buffer and updates the running sum.
+
+    Args:
+        buf (np.ndarray): The (window, d) ring buffer, mutated in place.
+        sums (np.ndarray): The running sum vector, mutated in place.
+        head (int): The current write position.
+        full (bool): Whether the window has already wrapped.
+        x (np.ndarray): The incoming vector.
+
+    Returns:
+        int: The advanced write position.
+    """
+    for i in range(x.shape[0]):
+        if full:
+            sums[i] -= buf[head, i]
+        buf[head, i] = x[i]
+        sums[i] += x[i]
+
+    return (head + 1) % buf.shape[0]
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _mahal_sq_batch(cov_L: np.ndarray, diff: np.ndarray) -> np.ndarray:
+    """Computes squared Mahalanobis distances via forward substitution.
+
+    Solves L y = diff_row per row and accumulates ||y||^2, keeping the
+    distance path free of external linear-algebra dependencies (the
+    packaged build excludes scipy).
+
+    Args:
+        cov_L (np.ndarray): The lower-triangular Cholesky factor of the covariance.
+        diff (np.ndarray): The (n, d) matrix of deviation vectors.
+
+    Returns:
+        np.ndarray: The per-row squared Mahalanobis distances.
+    """
+    n, d = diff.shape
+    y = np.empty(d)
+    out = np.empty(n)
+
+    for row in range(n):
+        m_squared = 0.0
+        for i in range(d):
+            acc = diff[row, i]
+            for j in range(i):
+                acc -= cov_L[i, j] * y[j]
+            y[i] = acc / cov_L[i, i]
+            m_squared += y[i] * y[i]
+        out[row] = m_squared
+
+    return out
 
 
-def calculate_mahalanobis(x: np.ndarray, mu: np.ndarray, cov_inv: np.ndarray) -> float:
+def calculate_mahalanobis_batch(
+    X: np.ndarray, mu: np.ndarray, cov_L: np.ndarray
+) -> np.ndarray:
+    """Computes Mahalanobis distances for a batch of vectors.
+
+    One compiled pass covers every row, so training and retraining
+    calibrate thresholds without a Python loop over samples.
+
+    Args:
+        X (np.ndarray): The (n, d) matrix of input vectors.
+        mu (np.ndarray): The mean vector.
+        cov_L (np.ndarray): The lower-triangular Cholesky factor of the covariance.
+
+    Returns:
+        np.ndarray: The per-row Mahalanobis distances.
+    """
+    return np.sqrt(np.maximum(_mahal_sq_batch(cov_L, X - mu), 0.0))
+
+
+def calculate_mahalanobis(x: np.ndarray, mu: np.ndarray, cov_L: np.ndarray) -> float:
     """Computes the Mahalanobis distance.
 
     Args:
         x (np.ndarray): The input vector.
         mu (np.ndarray): The mean vector.
-        cov_inv (np.ndarray): The inverse covariance matrix.
+        cov_L (np.ndarray): The lower-triangular Cholesky factor of the covariance.
 
     Returns:
         float: The calculated Mahalanobis distance.
     """
-    delta = x - mu
-    m_squared = delta @ cov_inv @ delta
+    m_squared = _mahal_sq_batch(cov_L, (x - mu).reshape(1, -1))[0]
 
-    return float(np.sqrt(max(0.0, m_squared)))
+    return float(np.sqrt(max(m_squared, 0.0)))
 
 
 class RollingWindowMath:
@@ -34,15 +117,44 @@ class RollingWindowMath:
             window_size (int, optional): The capacity of the rolling window. Defaults to 5.
         """
         self.window_size = window_size
-        self.buffer = deque(maxlen=window_size)
+        self._inv_window = 1.0 / window_size
+        self._buffer: np.ndarray | None = None
+        self._sum: np.ndarray | None = None
+        self._head = 0
+        self._count = 0
 
     def append(self, value: np.ndarray | float):
         """Adds a new value to the rolling window.
 
+        Maintains a running sum incrementally: the evicted entry is
+        subtracted and the new one added, so the mean costs O(d)
+        regardless of the window size.
+
         Args:
             value (np.ndarray | float): The data point to append.
         """
-        self.buffer.append(value)
+        if self._buffer is None:
+            shape = np.shape(value)
+            dtype = getattr(value, "dtype", np.float64)
+            self._buffer = np.zeros((self.window_size,) + shape, dtype=dtype)
+            self._sum = np.zeros(shape, dtype=dtype)
+
+        full = self._count == self.window_size
+        if not full:
+            self._count += 1
+
+        if self._buffer.ndim == 2:
+            self._head = _roll_update(
+                self._buffer, self._sum, self._head, full, value
+            )
+            return
+
+        if full:
+            self._sum -= self._buffer[self._head]
+
+        self._buffer[self._head] = value
+        self._sum += self._buffer[self._head]
+        self._head = (self._head + 1) % self.window_size
 
     def get_mean(self) -> np.ndarray | float:
         """Returns the mean of the current window.
@@ -50,9 +162,13 @@ class RollingWindowMath:
         Returns:
             np.ndarray | float: The calculated mean, or 0.0 if the buffer is empty.
         """
-        if not self.buffer:
+        if self._count == 0:
             return 0.0
-        return np.mean(self.buffer, axis=0)
+
+        if self._count == self.window_size:
+            return self._sum * self._inv_window
+
+        return self._sum / self._count
 
     def is_full(self) -> bool:
         """Checks if the window has reached its target size.
@@ -60,4 +176,4 @@ class RollingWindowMath:
         Returns:
             bool: True if the window is full, False otherwise.
         """
-        return len(self.buffer) == self.window_size
+        return self._count == self.window_size